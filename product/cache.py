@@ -0,0 +1,39 @@
+"""Tiny in-process TTL cache for read-heavy responses.
+
+Product detail pages are read far more often than they change, so the detail
+handler stores its result here for a short window. Write handlers must call
+invalidate_product so a stale entry never outlives an update or delete. The
+interface is deliberately small; a Redis backend could replace the dict if the
+app ever runs on more than one process.
+"""
+import time
+
+TTL_SECONDS = 60
+MAX_ENTRIES = 1024 # hard cap so a large catalog cannot grow the process heap without limit
+
+_product_cache = {}
+
+def get_cached_product(product_id):
+    entry = _product_cache.get(product_id)
+    if entry is None:
+        return None
+    value, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _product_cache.pop(product_id, None)
+        return None
+    return value
+
+def cache_product(product_id, value):
+    now = time.monotonic()
+    # sweep expired entries on insert — reads only evict the key they touch, so without
+    # this, entries for ids that are never re-read would be retained forever
+    for key in [k for k, (_, expires_at) in _product_cache.items() if now >= expires_at]:
+        _product_cache.pop(key, None)
+    # still full of live entries: evict the oldest insertions (dicts keep insertion order)
+    _product_cache.pop(product_id, None)
+    while len(_product_cache) >= MAX_ENTRIES:
+        _product_cache.pop(next(iter(_product_cache)))
+    _product_cache[product_id] = (value, now + TTL_SECONDS)
+
+def invalidate_product(product_id):
+    _product_cache.pop(product_id, None)
@@ -1,23 +1,44 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base
 
-SQLALCHEMY_DATABASE_URL = 'sqlite:///./product.db'
+SQLALCHEMY_DATABASE_URL = 'sqlite+aiosqlite:///./product.db'
 
 # database connections(a pool of them) is established through the engine
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={
-    "check_same_thread": False
-})
+# the async engine lets one event loop multiplex many in-flight queries instead of
+# parking a threadpool worker on every database round-trip
+# pool sizing is explicit so concurrent requests queue for a connection instead of
+# opening unbounded handles; pre_ping/recycle drop stale connections before use
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    query_cache_size=1200, # compiled-statement cache; roomy enough that hot statements never get evicted and recompiled
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    insertmanyvalues_page_size=1000, # caps how many rows a single multi-row INSERT carries, so huge bulk payloads are chunked instead of built as one giant statement
+)
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets readers proceed while a writer holds the lock, which is the main
+    # source of stalls when several requests hit the same SQLite file
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON") # SQLite ignores ON DELETE CASCADE unless FK enforcement is switched on per connection
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
 
 # sessionmaker is a factory for creating Session objects, a session is a booking of a database connection through which a transaction is made
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# expire_on_commit=False keeps loaded objects usable after commit without a reload SELECT
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # declarative_base is a base class for all models, it provides functionalities that map models to the database tables and ORM functionalities
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db # yield creates a generator that can be paused and resumed
-    finally:
-        db.close()
\ No newline at end of file
+async def get_db():
+    async with SessionLocal() as db: # the context manager closes the session once the request is done
+        yield db
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from typing import List
+from sqlalchemy.orm import configure_mappers
 from .import models
 from .database import engine
 from .routers import product, seller
@@ -24,6 +25,12 @@ app = FastAPI(
 app.include_router(seller.router)
 app.include_router(product.router)
 
-models.Base.metadata.create_all(engine)
+@app.on_event("startup")
+async def create_tables():
+    # finalize all relationship mappings now so the first request doesn't pay the configure cost
+    configure_mappers()
+    # create_all is synchronous, so run it on the async engine's underlying sync connection
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
 
 
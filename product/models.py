@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, select, func
+from sqlalchemy.orm import relationship, column_property
 from .database import Base
 
 class Product(Base):
@@ -7,8 +7,8 @@ class Product(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String)
     description = Column(String)
-    price = Column(Integer)
-    seller_id = Column(Integer, ForeignKey('sellers.id')) # Creates foreigh key relationship, thus a one-to-many relationship.
+    price = Column(Integer, index=True) # lets price-range filters and min/max aggregates read from the B-tree instead of scanning the table
+    seller_id = Column(Integer, ForeignKey('sellers.id', ondelete='CASCADE'), index=True) # Creates foreigh key relationship, thus a one-to-many relationship. Indexed so lookups of a seller's products are range scans, not table scans.
     seller = relationship("Seller", back_populates='products') # This relationship allows to reach seller from the product row and vice-versa because same is defined down below.
 
 class Seller(Base):
@@ -17,4 +17,11 @@ class Seller(Base):
     name = Column(String)
     email = Column(String)
     password = Column(String)
-    products = relationship("Product", back_populates='seller')
+    # the count is computed by the database as a correlated subquery whenever a seller row is
+    # selected, so callers get it without loading (or even counting over) the product collection
+    product_count = column_property(
+        select(func.count(Product.id)).where(Product.seller_id == id).correlate_except(Product).scalar_subquery()
+    )
+    # passive_deletes leaves cascading to the database's ON DELETE CASCADE, so deleting a
+    # seller is one DELETE statement instead of loading every product to delete it row by row
+    products = relationship("Product", back_populates='seller', passive_deletes=True)
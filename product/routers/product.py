@@ -1,57 +1,142 @@
-from fastapi import APIRouter, Depends, status, HTTPException, Response
-from sqlalchemy.orm import Session
+"""Product routes.
+
+List endpoints eager-load every relationship they serialize and finish their
+.options(...) chain with raiseload('*'), so any future edit that touches an
+unloaded relationship fails loudly in development instead of silently
+re-introducing N+1 lazy loads.
+"""
+import time
+from fastapi import APIRouter, Depends, status, HTTPException, Query
+from sqlalchemy import select, insert, update, delete, func, lambda_stmt
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload, raiseload, load_only
 from ..database import get_db
-from ..schemas import Product, DisplayProduct
+from ..schemas import Product, DisplayProduct, ProductListResponse
+from ..cache import get_cached_product, cache_product, invalidate_product
 from .. import models
-from typing import List
+from typing import List, Optional
 
 router = APIRouter(
     tags=["Product"],
     prefix="/product"
 )
 
+# Loader options built once at import time so the lambda-cached statement below
+# never rebuilds them per request.
+# load_only keeps the SELECTs down to the columns the response models actually
+# serialize (the pk comes along for free) — the seller's bcrypt hash in particular
+# never leaves the database.
+_PRODUCT_LIST_OPTS = (
+    load_only(models.Product.name, models.Product.description),
+    selectinload(models.Product.seller).load_only(models.Seller.name, models.Seller.email, models.Seller.product_count),
+    raiseload('*'),
+)
+
+# The catalog total changes slowly and nobody needs it exact, so one COUNT per
+# time bucket serves every list request in that window instead of a COUNT per call.
+_TOTAL_TTL_SECONDS = 5
+_total_cache = (None, 0) # (bucket, value)
+
+async def _approx_total(db):
+    global _total_cache
+    bucket = int(time.time()) // _TOTAL_TTL_SECONDS
+    if _total_cache[0] != bucket:
+        total = (await db.execute(select(func.count()).select_from(models.Product))).scalar()
+        _total_cache = (bucket, total)
+    return _total_cache[1]
+
 # Injection DB session using Depends and cleanup is done after the call finishes, yield ensures of that
 # status_code can be added this way
 @router.post('/', status_code=status.HTTP_201_CREATED)
-def add(product: Product, db: Session = Depends(get_db)):
+async def add(product: Product, db: AsyncSession = Depends(get_db)):
     new_product = models.Product(name = product.name, description = product.description, price = product.price, seller_id = 1)
     db.add(new_product)
-    db.commit()
-    db.refresh(new_product) # Updates the Python object with database-generated values. For example, if your table has an auto-incrementing ID, this fills in the ID
+    try:
+        await db.commit()
+    except IntegrityError:
+        # the hardcoded seller_id has no matching seller row, and foreign keys are enforced
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Seller does not exist")
+    # no refresh needed: expire_on_commit=False keeps the object's attributes after commit,
+    # and the flush already filled in the auto-incremented id
     return product
 
 
+# Bulk creation: one executemany INSERT (insertmanyvalues) in one transaction, instead of
+# paying an add/commit round-trip per row when seeding many products.
+@router.post('/bulk', status_code=status.HTTP_201_CREATED)
+async def add_bulk(products: List[Product], db: AsyncSession = Depends(get_db)):
+    rows = [{**p.model_dump(), 'seller_id': 1} for p in products]
+    if rows:
+        try:
+            await db.execute(insert(models.Product), rows)
+            await db.commit()
+        except IntegrityError:
+            # the hardcoded seller_id has no matching seller row, and foreign keys are enforced
+            await db.rollback()
+            raise HTTPException(status_code=400, detail="Seller does not exist")
+    return {'inserted': len(rows)}
+
+
 @router.get('/{id}', response_model=DisplayProduct)
-def get_product(id, db: Session = Depends(get_db)):
-    product = db.query(models.Product).filter(models.Product.id == id).first()
+async def get_product(id: int, db: AsyncSession = Depends(get_db)):
+    # detail pages are read-heavy, serve repeats from the short-TTL cache and skip the DB entirely
+    cached = get_cached_product(id)
+    if cached is not None:
+        return cached
+    # Session.get checks the identity map first and uses a precompiled SELECT for the PK lookup;
+    # joinedload pulls the seller in the same SELECT, a join is cheap for a single row,
+    # and load_only trims both rows to the columns DisplayProduct serializes
+    product = await db.get(models.Product, id, options=[
+        load_only(models.Product.name, models.Product.description),
+        joinedload(models.Product.seller).load_only(models.Seller.name, models.Seller.email, models.Seller.product_count),
+    ])
     if not product:
         # Need to send the error message this way because the response model is set and its not possible to send message as DisplayProduct response model
         raise HTTPException(status_code=404, detail="Product not found")
+    cache_product(id, product)
     return product
 
-@router.get('/', response_model=List[DisplayProduct])
-def get_products(response: Response, db: Session = Depends(get_db)):
-    products = db.query(models.Product).all()
-    return products
+# Keyset (seek) pagination: instead of OFFSET, which makes the database scan and throw away
+# all the skipped rows, we filter on id > after_id so every page is an indexed range scan.
+@router.get('/', response_model=ProductListResponse)
+async def get_products(after_id: Optional[int] = None, limit: int = Query(100, ge=1, le=1000), db: AsyncSession = Depends(get_db)):
+    # selectinload fetches all the sellers for the page in one extra SELECT ... WHERE id IN (...),
+    # instead of one lazy SELECT per product while serializing (the classic N+1 pattern).
+    # lambda_stmt memoizes the statement construction/compilation on the lambda's code
+    # object, so repeat requests only rebind after_id/limit instead of recompiling SQL.
+    stmt = lambda_stmt(lambda: select(models.Product).options(*_PRODUCT_LIST_OPTS).order_by(models.Product.id.asc()))
+    if after_id is not None:
+        stmt += lambda s: s.where(models.Product.id > after_id)
+    stmt += lambda s: s.limit(limit + 1) # fetch one extra row to know whether another page exists
+    result = await db.execute(stmt)
+    rows = result.scalars().all()
+    items = rows[:limit]
+    has_more = len(rows) > limit
+    next_cursor = items[-1].id if has_more else None
+    return ProductListResponse(items=items, total=await _approx_total(db), has_more=has_more, next_cursor=next_cursor)
 
 @router.put('/{id}')
-def update(id, request: Product, db: Session = Depends(get_db)):
-    product = db.query(models.Product).filter(models.Product.id == id)
-    if product.first():
-        product.update(request.dict())
-        db.commit()
-        return {'message': "Product updated successfully!!"}
-    else:
-        return {'message': "Product not found!!"}
+async def update_product(id: int, request: Product, db: AsyncSession = Depends(get_db)):
+    # One UPDATE ... WHERE instead of SELECT + mutate + flush; the rowcount tells
+    # us whether the product existed, so no row is ever loaded just to overwrite it.
+    # exclude_unset keeps fields the client never sent out of the SET clause, so their
+    # columns (and any index on them) are not rewritten for nothing.
+    result = await db.execute(update(models.Product).where(models.Product.id == id).values(**request.model_dump(exclude_unset=True)))
+    await db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Product not found")
+    invalidate_product(id) # the cached detail response is stale now
+    return {'message': "Product updated successfully!!"}
 
 @router.delete('/{id}')
-def delete(id, db: Session = Depends(get_db)):
-    # Does not synchronize all the ojects in the current session to reflect the deletion.
-    db.query(models.Product).filter(models.Product.id == id).delete(synchronize_session=False) 
-    db.commit()
-
-    all_products = db.query(models.Product).all()
-
-    for product in all_products:
-        print(product.id)
-    return {'message': f'Product with id = {id}, is now deleted'}
\ No newline at end of file
+async def delete_product(id: int, db: AsyncSession = Depends(get_db)):
+    # Core delete does not synchronize the objects in the current session to reflect the deletion.
+    # The statement's rowcount doubles as the existence check, so no SELECT is needed up front.
+    result = await db.execute(delete(models.Product).where(models.Product.id == id))
+    await db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Product not found")
+    invalidate_product(id) # the cached detail response is stale now
+    return {'message': f'Product with id = {id}, is now deleted'}
@@ -1,24 +1,72 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, insert, func, exists
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
 from .. import models
 from ..schemas import Seller, DisplaySeller
 from ..database import get_db
-from passlib.context import CryptContext
+from ..security import pwd_context
 
 router = APIRouter(
     tags=["Seller"],
     prefix="/seller"
 )
 
-# This is a password hashing manager from the passlib library
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated = "auto") # where bcrypt is industry standard hashing algorithm, deprecated = "auto" automatically handles deprecated hashing schemes.
+# Two single-row aggregates instead of one query over Seller OUTER JOIN products:
+# the join would duplicate each seller row once per product, so count(Seller.id)
+# over the joined rowset is both wrong and expensive.
+@router.get('/statistics')
+async def get_seller_statistics(db: AsyncSession = Depends(get_db)):
+    seller_count = (await db.execute(select(func.count(models.Seller.id)))).scalar()
+    product_count, avg_price, min_price, max_price = (await db.execute(
+        select(
+            func.count(models.Product.id),
+            func.avg(models.Product.price),
+            func.min(models.Product.price),
+            func.max(models.Product.price)
+        )
+    )).one()
+    return {
+        'seller_count': seller_count,
+        'product_count': product_count,
+        'average_price': avg_price,
+        'min_price': min_price,
+        'max_price': max_price
+    }
+
+# A single indexed COUNT on products.seller_id, without loading the seller row first.
+# The seller existence probe only runs when the count is zero, so the common case
+# stays a one-query endpoint.
+@router.get('/{id}/products/count')
+async def get_seller_product_count(id: int, db: AsyncSession = Depends(get_db)):
+    count = (await db.execute(select(func.count(models.Product.id)).where(models.Product.seller_id == id))).scalar()
+    if count == 0 and not (await db.execute(select(exists().where(models.Seller.id == id)))).scalar():
+        raise HTTPException(status_code=404, detail="Seller not found")
+    return {'seller_id': id, 'product_count': count}
 
 @router.post('/', response_model=DisplaySeller)
-def add_seller(request: Seller, db: Session = Depends(get_db)):
-    hashed_password = pwd_context.hash(request.password)
+async def add_seller(request: Seller, db: AsyncSession = Depends(get_db)):
+    # bcrypt is deliberately CPU-heavy, run it on the threadpool so it cannot stall the event loop
+    hashed_password = await run_in_threadpool(pwd_context.hash, request.password)
     new_seller = models.Seller(name = request.name, email = request.email, password = hashed_password)
     db.add(new_seller)
-    db.commit()
-    db.refresh(new_seller)
+    await db.commit()
+    # one refresh so the database-computed product_count column_property is populated;
+    # lazy-loading it during serialization is not possible on an async session
+    await db.refresh(new_seller)
 
     return new_seller
+
+# Bulk registration: bcrypt each password on its own threadpool worker in parallel
+# (the hash is CPU-bound), then land all rows with one executemany INSERT instead of
+# one commit per seller.
+@router.post('/bulk', status_code=status.HTTP_201_CREATED)
+async def add_sellers_bulk(sellers: List[Seller], db: AsyncSession = Depends(get_db)):
+    hashes = await asyncio.gather(*(run_in_threadpool(pwd_context.hash, s.password) for s in sellers))
+    rows = [{'name': s.name, 'email': s.email, 'password': h} for s, h in zip(sellers, hashes)]
+    if rows:
+        await db.execute(insert(models.Seller), rows)
+        await db.commit()
+    return {'inserted': len(rows)}
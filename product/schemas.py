@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, EmailStr
+from typing import List, Optional
 
 class Product(BaseModel):
     name: str
@@ -7,19 +8,26 @@ class Product(BaseModel):
 
 class Seller(BaseModel):
     name: str
-    email: str
+    email: EmailStr # parsed by email-validator's linear-time parser instead of a backtracking regex
     password: str
 
 class DisplaySeller(BaseModel):
     name: str
-    email: str
-    class Config:
-        from_attributes = True
+    email: EmailStr
+    product_count: int = 0 # computed in SQL via column_property, not by loading the products
+    model_config = ConfigDict(from_attributes=True)
 
 class DisplayProduct(BaseModel):
     name: str
     description: str
-    seller_id: DisplaySeller
-    
-    class Config:
-        from_attributes = True # allows conversion of sqlalchemy object to pydantic object, they must share same name and compatible type.
\ No newline at end of file
+    seller: DisplaySeller # nested seller comes from the relationship, not the raw seller_id column
+
+    model_config = ConfigDict(from_attributes=True) # allows conversion of sqlalchemy object to pydantic object, they must share same name and compatible type.
+
+class ProductListResponse(BaseModel):
+    items: List[DisplayProduct]
+    total: Optional[int] = None # approximate row count refreshed every few seconds, never an exact per-request COUNT(*)
+    has_more: bool = False # cheap limit+1 probe, avoids issuing a COUNT(*) with every page
+    next_cursor: Optional[int] = None # id of the last item on this page, pass it back as after_id to get the next page
+
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,9 @@
+from passlib.context import CryptContext
+
+# Single module-wide hashing context: building a CryptContext is not free, and sharing
+# one instance keeps the scheme/cost configuration in exactly one place.
+# bcrypt is intentionally CPU-heavy, so async handlers must call pwd_context.hash through
+# run_in_threadpool rather than directly on the event loop.
+# bcrypt__rounds pins the work factor explicitly (2^12 iterations) so the CPU cost per hash
+# is a deliberate, tunable choice rather than whatever the library defaults to.
+pwd_context = CryptContext(schemes=['bcrypt'], bcrypt__rounds=12, deprecated = "auto") # where bcrypt is industry standard hashing algorithm, deprecated = "auto" automatically handles deprecated hashing schemes.